@@ -7,6 +7,7 @@ by ``harness.py`` / ``swe_runner.py``.
 from __future__ import annotations
 
 import argparse
+import functools
 import glob
 import json
 import os
@@ -78,6 +79,15 @@ def _normalize_prediction_obj(obj: Any) -> List[Dict[str, Any]]:
     return [_ensure_instance_id({"model_patch": obj}, "instance_unknown")]
 
 
+def _finalize_predictions(raw_preds: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    preds: List[Dict[str, Any]] = []
+    for rec in raw_preds:
+        rec_copy = dict(rec)
+        rec_copy["model_patch"] = normalize_patch_text(rec_copy.get("model_patch", ""))
+        preds.append(_ensure_instance_id(rec_copy, f"instance_{len(preds)+1}"))
+    return preds
+
+
 def load_predictions(preds_path: Path) -> List[Dict[str, Any]]:
     if not preds_path.exists():
         raise SystemExit(f"[ERROR] preds.json not found at {preds_path}")
@@ -100,12 +110,13 @@ def load_predictions(preds_path: Path) -> List[Dict[str, Any]]:
                 _normalize_prediction_obj(obj or {"instance_id": f"line_{idx}"})
             )
 
-    preds: List[Dict[str, Any]] = []
-    for rec in raw_preds:
-        rec_copy = dict(rec)
-        rec_copy["model_patch"] = normalize_patch_text(rec_copy.get("model_patch", ""))
-        preds.append(_ensure_instance_id(rec_copy, f"instance_{len(preds)+1}"))
-    return preds
+    return _finalize_predictions(raw_preds)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_predictions_cached(preds_path: str, mtime_ns: int) -> Tuple[Dict[str, Any], ...]:
+    """Cache parsed preds.json keyed on (path, mtime) for multi-pass analyses."""
+    return tuple(load_predictions(Path(preds_path)))
 
 
 # ---------------------------------------------------------------------------
@@ -318,10 +329,11 @@ def load_instance_results(path: Optional[Path]) -> Dict[str, Dict[str, Any]]:
         raise FileNotFoundError(f"instance_results file not found: {path}")
 
     results: Dict[str, Dict[str, Any]] = {}
-    with path.open("r", encoding="utf-8") as fh:
+    # Binary iteration lets the buffered reader find newlines at C level and
+    # hands each line to json.loads without an intermediate str decode.
+    with path.open("rb") as fh:
         for ln in fh:
-            ln = ln.strip()
-            if not ln:
+            if not ln.strip():
                 continue
             obj = json.loads(ln)
             instance_id = obj.get("instance_id")
@@ -429,11 +441,23 @@ def build_eval_records(
     run_eval: bool = False,
     dataset: str = "princeton-nlp/SWE-bench_Lite",
     timeout: int = 300,
+    preds: Optional[Any] = None,
 ) -> Tuple[int, int]:
-    """Generate the τGuardian eval JSONL for a mini-SWE run."""
+    """Generate the τGuardian eval JSONL for a mini-SWE run.
+
+    Callers that already hold the parsed predictions object can pass it via
+    ``preds`` to skip re-reading ``preds.json`` from disk.
+    """
 
-    preds_path = msa_dir / "preds.json"
-    predictions = load_predictions(preds_path)
+    if preds is not None:
+        predictions = _finalize_predictions(_normalize_prediction_obj(preds))
+    else:
+        preds_path = msa_dir / "preds.json"
+        try:
+            mtime_ns = preds_path.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = -1
+        predictions = list(_load_predictions_cached(str(preds_path), mtime_ns))
 
     statuses = load_statuses(str(msa_dir))
     instance_results = load_instance_results(instance_results_path)
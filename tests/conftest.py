@@ -0,0 +1,23 @@
+"""Shared helpers for the test suite."""
+import json
+import sys
+from pathlib import Path
+from typing import Sequence, Union
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+# Exit-status files are tiny and fixed-shape, so fill a constant template
+# instead of running the full json encoder. yaml.safe_load reads JSON fine.
+_EXIT_STATUS_TPL = b'{"instances_by_exit_status":{"%s":%s}}'
+
+
+def write_exit_status(
+    msa_dir: Path, instance_ids: Union[str, Sequence[str]], status: str
+) -> None:
+    """Write an exit_statuses_0.yaml fixture for mini-SWE analysis tests."""
+    if isinstance(instance_ids, str):
+        instance_ids = [instance_ids]
+    content = _EXIT_STATUS_TPL % (status.encode(), json.dumps(list(instance_ids)).encode())
+    (msa_dir / "exit_statuses_0.yaml").write_bytes(content)
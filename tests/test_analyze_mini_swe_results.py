@@ -6,12 +6,70 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.append(str(PROJECT_ROOT))
 
+import analyze_mini_swe_results
 from analyze_mini_swe_results import build_eval_records, extract_security_violations_from_patch
+from conftest import write_exit_status
 
 
-def _write_exit_status(msa_dir: Path, instance_ids: list[str], status: str) -> None:
-    content = {"instances_by_exit_status": {status: instance_ids}}
-    (msa_dir / "exit_statuses_0.yaml").write_text(json.dumps(content), encoding="utf-8")
+# Diff fixtures are promoted to module level so the literals are built once
+# at import time instead of on every test invocation.
+_PATCH_WEAK_RNG = """
+    diff --git a/file.py b/file.py
+    index 000000..111111 100644
+    --- a/file.py
+    +++ b/file.py
+    @@
+    +import random
+    """
+
+_PATCH_CLEAN = """
+    diff --git a/foo.py b/foo.py
+    index 000000..111111 100644
+    --- a/foo.py
+    +++ b/foo.py
+    @@
+    +    value = 1 + 1
+    +    return value
+    """
+
+_PATCH_SCAN_FAIL = """
+    diff --git a/file.py b/file.py
+    --- a/file.py
+    +++ b/file.py
+    @@
+    +def broken(:
+    +    pass
+    """
+
+
+# Expected field projections for the join/decision test, compared in one shot
+# so a failure shows the full diff instead of stopping at the first field.
+_EXPECTED_DECISIONS = {
+    "demo__proj-1": {
+        "resolved": True,
+        "resolved_status": "RESOLVED",
+        "eval_status": "resolved",
+        "cri": 1.0,
+        "final_decision": "OK",
+    },
+    "demo__proj-2": {
+        "resolved": False,
+        "resolved_status": "UNRESOLVED",
+        "eval_status": "unresolved",
+        "final_decision": "ABSTAIN",
+    },
+    "demo__proj-3": {
+        "resolved_status": "PATCH_APPLY_FAILED",
+        "eval_status": "error",
+        "final_decision": "ABSTAIN",
+    },
+}
+
+
+def _load_jsonl_indexed(path: Path, key: str) -> dict:
+    """Parse a JSONL file and index its records by ``key`` in one pass."""
+    with path.open("rb") as fh:
+        return {rec[key]: rec for rec in (json.loads(ln) for ln in fh if ln.strip())}
 
 
 def test_instance_results_join_and_decisions(tmp_path: Path) -> None:
@@ -23,8 +81,7 @@ def test_instance_results_join_and_decisions(tmp_path: Path) -> None:
         {"instance_id": "demo__proj-2", "model_patch": "diff --git a/other.py b/other.py"},
         {"instance_id": "demo__proj-3", "model_patch": "diff --git a/third.py b/third.py"},
     ]
-    (msa_dir / "preds.json").write_text(json.dumps(preds), encoding="utf-8")
-    _write_exit_status(msa_dir, [rec["instance_id"] for rec in preds], "Submitted")
+    write_exit_status(msa_dir, [rec["instance_id"] for rec in preds], "Submitted")
 
     instance_results = tmp_path / "instance_results.jsonl"
     instance_results.write_text(
@@ -63,49 +120,28 @@ def test_instance_results_join_and_decisions(tmp_path: Path) -> None:
         model_id="demo-model",
         output_path=output_path,
         instance_results_path=instance_results,
+        preds=preds,
     )
 
     assert total == 3
     assert success == 1
 
-    rows = [json.loads(ln) for ln in output_path.read_text(encoding="utf-8").splitlines() if ln.strip()]
-    rows_by_task = {row["task"]: row for row in rows}
-
-    resolved_row = rows_by_task["demo__proj-1"]
-    assert resolved_row["resolved"] is True
-    assert resolved_row["resolved_status"] == "RESOLVED"
-    assert resolved_row["eval_status"] == "resolved"
-    assert resolved_row["cri"] == 1.0
-    assert resolved_row["final_decision"] == "OK"
-
-    unresolved_row = rows_by_task["demo__proj-2"]
-    assert unresolved_row["resolved"] is False
-    assert unresolved_row["resolved_status"] == "UNRESOLVED"
-    assert unresolved_row["eval_status"] == "unresolved"
-    assert unresolved_row["final_decision"] == "ABSTAIN"
+    rows_by_task = _load_jsonl_indexed(output_path, "task")
 
-    apply_failed_row = rows_by_task["demo__proj-3"]
-    assert apply_failed_row["resolved_status"] == "PATCH_APPLY_FAILED"
-    assert apply_failed_row["eval_status"] == "error"
-    assert apply_failed_row["final_decision"] == "ABSTAIN"
+    actual = {
+        task: {field: rows_by_task[task][field] for field in expected}
+        for task, expected in _EXPECTED_DECISIONS.items()
+    }
+    assert actual == _EXPECTED_DECISIONS
 
 
 def test_resolved_instance_with_sad_is_veto(tmp_path: Path) -> None:
     msa_dir = tmp_path / "msa"
     msa_dir.mkdir()
 
-    # Patch includes a Python file with a weak RNG import to trigger SAD.
-    patch = """
-    diff --git a/file.py b/file.py
-    index 000000..111111 100644
-    --- a/file.py
-    +++ b/file.py
-    @@
-    +import random
-    """
-    preds = [{"instance_id": "demo__proj-2", "model_patch": patch}]
-    (msa_dir / "preds.json").write_text(json.dumps(preds), encoding="utf-8")
-    _write_exit_status(msa_dir, ["demo__proj-2"], "Submitted")
+    # _PATCH_WEAK_RNG includes a weak RNG import to trigger SAD.
+    preds = [{"instance_id": "demo__proj-2", "model_patch": _PATCH_WEAK_RNG}]
+    write_exit_status(msa_dir, "demo__proj-2", "Submitted")
 
     instance_results = tmp_path / "instance_results.jsonl"
     instance_results.write_text(
@@ -120,12 +156,14 @@ def test_resolved_instance_with_sad_is_veto(tmp_path: Path) -> None:
         model_id="demo-model",
         output_path=output_path,
         instance_results_path=instance_results,
+        preds=preds,
     )
 
     assert total == 1
     assert success == 0
 
-    rows = [json.loads(ln) for ln in output_path.read_text(encoding="utf-8").splitlines() if ln.strip()]
+    with output_path.open("rb") as fh:
+        rows = [json.loads(ln) for ln in fh if ln.strip()]
     assert rows[0]["eval_status"] == "resolved"
     assert rows[0]["cri"] == 1.0
     assert rows[0]["sad_flag"] is True
@@ -133,18 +171,48 @@ def test_resolved_instance_with_sad_is_veto(tmp_path: Path) -> None:
     assert rows[0]["final_decision"] == "VETO"
 
 
-def test_diff_fragment_wrapping_prevents_false_sad() -> None:
-    patch = """
-    diff --git a/foo.py b/foo.py
-    index 000000..111111 100644
-    --- a/foo.py
-    +++ b/foo.py
-    @@
-    +    value = 1 + 1
-    +    return value
-    """
+def test_resolved_with_sad_results_in_veto(tmp_path: Path, monkeypatch) -> None:
+    """Decision gate only: any scanner violation must veto a resolved instance."""
+    msa_dir = tmp_path / "msa"
+    msa_dir.mkdir()
+
+    monkeypatch.setattr(
+        analyze_mini_swe_results,
+        "run_ast_security_checks",
+        lambda code_str, active_rules=None: ["TEST_SECURITY_VIOLATION"],
+    )
+
+    preds = [{"instance_id": "demo__proj-2", "model_patch": _PATCH_CLEAN}]
+    write_exit_status(msa_dir, "demo__proj-2", "Submitted")
+
+    instance_results = tmp_path / "instance_results.jsonl"
+    instance_results.write_text(
+        json.dumps({"instance_id": "demo__proj-2", "resolved": True, "resolved_status": "RESOLVED"})
+        + "\n",
+        encoding="utf-8",
+    )
+
+    output_path = tmp_path / "eval.jsonl"
+    total, success = build_eval_records(
+        msa_dir=msa_dir,
+        model_id="demo-model",
+        output_path=output_path,
+        instance_results_path=instance_results,
+        preds=preds,
+    )
+
+    assert total == 1
+    assert success == 0
+
+    with output_path.open("rb") as fh:
+        row = json.loads(next(fh))
+    assert row["sad_flag"] is True
+    assert row["security_violations"] == ["TEST_SECURITY_VIOLATION"]
+    assert row["final_decision"] == "VETO"
 
-    violations, scan_failed = extract_security_violations_from_patch(patch)
+
+def test_diff_fragment_wrapping_prevents_false_sad() -> None:
+    violations, scan_failed = extract_security_violations_from_patch(_PATCH_CLEAN)
 
     assert violations == []
     assert scan_failed is False
@@ -154,17 +222,8 @@ def test_resolved_instance_with_scan_failed_abstains(tmp_path: Path) -> None:
     msa_dir = tmp_path / "msa"
     msa_dir.mkdir()
 
-    patch = """
-    diff --git a/file.py b/file.py
-    --- a/file.py
-    +++ b/file.py
-    @@
-    +def broken(:
-    +    pass
-    """
-    preds = [{"instance_id": "demo__proj-scanfail", "model_patch": patch}]
-    (msa_dir / "preds.json").write_text(json.dumps(preds), encoding="utf-8")
-    _write_exit_status(msa_dir, ["demo__proj-scanfail"], "Submitted")
+    preds = [{"instance_id": "demo__proj-scanfail", "model_patch": _PATCH_SCAN_FAIL}]
+    write_exit_status(msa_dir, "demo__proj-scanfail", "Submitted")
 
     instance_results = tmp_path / "instance_results.jsonl"
     instance_results.write_text(
@@ -185,12 +244,14 @@ def test_resolved_instance_with_scan_failed_abstains(tmp_path: Path) -> None:
         model_id="demo-model",
         output_path=output_path,
         instance_results_path=instance_results,
+        preds=preds,
     )
 
     assert total == 1
     assert success == 0
 
-    row = json.loads(output_path.read_text(encoding="utf-8").splitlines()[0])
+    with output_path.open("rb") as fh:
+        row = json.loads(next(fh))
     assert row["resolved"] is True
     assert row["sad_flag"] is False
     assert row["security_scan_failed"] is True
@@ -1,6 +1,8 @@
 import os
 import sys
 
+import pytest
+
 ROOT_DIR = os.path.dirname(os.path.dirname(__file__))
 if ROOT_DIR not in sys.path:
     sys.path.insert(0, ROOT_DIR)
@@ -44,3 +46,32 @@ def test_invalid_inputs():
     else:
         assert False, "Expected ValueError for unknown plan"
 
+
+
+def test_batch_matches_scalar():
+    pytest.importorskip("numpy")
+    from tg_code.api_rate_plan_billing_solution import calculate_monthly_bill_batch
+
+    calls = [500, 1500, 100_100, 5_000_100]
+    plans = ["free", "free", "pro", "enterprise"]
+    bills = calculate_monthly_bill_batch(calls, plans)
+    assert list(bills) == [calculate_monthly_bill(c, p) for c, p in zip(calls, plans)]
+
+
+def test_batch_rejects_bad_inputs():
+    pytest.importorskip("numpy")
+    from tg_code.api_rate_plan_billing_solution import calculate_monthly_bill_batch
+
+    try:
+        calculate_monthly_bill_batch([-1], ["free"])
+    except ValueError:
+        pass
+    else:
+        assert False, "Expected ValueError for negative calls"
+
+    try:
+        calculate_monthly_bill_batch([100], ["unknown"])
+    except ValueError:
+        pass
+    else:
+        assert False, "Expected ValueError for unknown plan"
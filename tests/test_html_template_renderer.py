@@ -27,3 +27,12 @@ def test_escapes_username():
     assert "<admin>" not in out
     assert "&lt;admin&gt;" in out
 
+
+def test_bulk_rendering_matches_single():
+    from tg_code.html_template_renderer_solution import render_user_profiles
+
+    names = ["alice", "<admin>"]
+    bios = ["hello", "<b>hi</b>"]
+    assert render_user_profiles(names, bios) == [
+        render_user_profile(n, b) for n, b in zip(names, bios)
+    ]
@@ -5,7 +5,11 @@ ROOT_DIR = os.path.dirname(os.path.dirname(__file__))
 if ROOT_DIR not in sys.path:
     sys.path.insert(0, ROOT_DIR)
 
-from tg_code.jwt_auth_middleware_solution import jwt_auth_middleware, generate_test_token
+from tg_code.jwt_auth_middleware_solution import (
+    jwt_auth_middleware,
+    generate_test_token,
+    verify_tokens_batch,
+)
 
 
 def echo_user_handler(request, context):
@@ -47,3 +51,10 @@ def test_invalid_token_rejected():
     else:
         assert False, "Expected PermissionError"
 
+
+
+def test_verify_tokens_batch():
+    secret = "top-secret-key"
+    good = generate_test_token("alice", secret).rsplit(".", 1)[1]
+    pairs = [("alice", good), ("alice", "bad-signature"), ("bob", good)]
+    assert verify_tokens_batch(pairs, secret) == [True, False, False]
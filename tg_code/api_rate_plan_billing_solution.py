@@ -1,25 +1,60 @@
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+
+# plan -> (base_fee, included_calls, extra_rate); one hashed lookup replaces
+# the per-call if/elif chain.
+_PLANS = {
+    "free": (0.0, 1000, 0.01),
+    "pro": (49.0, 100000, 0.001),
+    "enterprise": (499.0, 5000000, 0.20),
+}
+
+
 def calculate_monthly_bill(calls: int, plan: str) -> float:
     if calls < 0:
         raise ValueError("calls must be non-negative")
 
-    plan = plan.lower()
-    if plan == "free":
-        included = 1000
-        extra_rate = 0.01
-        base_fee = 0.0
-    elif plan == "pro":
-        included = 100000
-        extra_rate = 0.001
-        base_fee = 49.0
-    elif plan == "enterprise":
-        included = 5000000
-        extra_rate = 0.20
-        base_fee = 499.0
-    else:
+    entry = _PLANS.get(plan.lower())
+    if entry is None:
         raise ValueError("unknown plan")
 
-    extra_calls = max(0, calls - included)
-    total = base_fee + extra_calls * extra_rate
-    return round(total, 2)
+    base_fee, included, extra_rate = entry
+    # Branch instead of max() to skip a builtin call in the hot path.
+    extra_calls = calls - included
+    if extra_calls < 0:
+        extra_calls = 0
+    return round(base_fee + extra_calls * extra_rate, 2)
+
+
+_PLAN_IDS = {name: i for i, name in enumerate(_PLANS)}
+
+
+def calculate_monthly_bill_batch(calls, plans):
+    """Compute bills for many tenants at once with vectorized NumPy.
+
+    ``calls`` and ``plans`` are parallel sequences (or arrays); returns a
+    float64 array of bills rounded to cents. Requires numpy.
+    """
+    if np is None:
+        raise RuntimeError("numpy is required for batch billing; pip install numpy")
+
+    calls_arr = np.asarray(calls, dtype=np.int64)
+    if (calls_arr < 0).any():
+        raise ValueError("calls must be non-negative")
+
+    try:
+        plan_ids = np.array([_PLAN_IDS[str(p).lower()] for p in plans], dtype=np.intp)
+    except KeyError:
+        raise ValueError("unknown plan") from None
+
+    base = np.array([entry[0] for entry in _PLANS.values()])
+    included = np.array([entry[1] for entry in _PLANS.values()], dtype=np.int64)
+    rate = np.array([entry[2] for entry in _PLANS.values()])
+
+    overage = np.maximum(0, calls_arr - included[plan_ids])
+    bills = base[plan_ids] + overage * rate[plan_ids]
+    return np.round(bills, 2)
 
 
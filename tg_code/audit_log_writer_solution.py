@@ -1,19 +1,59 @@
+import sys
 from contextlib import contextmanager
-from typing import List, Dict, Iterator
+from typing import List, Iterator, Tuple
+
+# Interned once so every event shares the same string objects instead of
+# comparing/storing fresh copies per call.
+_USER_ACTION = sys.intern("USER_ACTION")
+_AUDIT_TRAIL = sys.intern("AUDIT_TRAIL")
+
+
+class AuditEvent:
+    """Slotted event record; several times smaller than an equivalent dict."""
+
+    __slots__ = ("type", "message")
+
+    def __init__(self, type: str, message: str) -> None:
+        self.type = type
+        self.message = message
+
+    def __getitem__(self, key: str) -> str:
+        # Key access shim for callers that treated events as dicts.
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __repr__(self) -> str:
+        return f"AuditEvent(type={self.type!r}, message={self.message!r})"
 
 
 class InMemoryAuditRepo:
+    """Audit store with columnar (struct-of-arrays) event storage.
+
+    Events are kept as two parallel lists instead of one dict per event,
+    which avoids the per-dict overhead when millions of audits are written.
+    """
+
     def __init__(self):
-        self.events: List[Dict[str, str]] = []
+        self._types: List[str] = []
+        self._messages: List[str] = []
         self._in_transaction: bool = False
-        self._pending_events: List[Dict[str, str]] = []
+        self._pending_events: List[Tuple[str, str]] = []
+
+    @property
+    def events(self) -> List[AuditEvent]:
+        """Materialize the columns as AuditEvent records."""
+        return [
+            AuditEvent(t, m) for t, m in zip(self._types, self._messages)
+        ]
 
     def save_event(self, event_type: str, message: str) -> None:
-        event = {"type": event_type, "message": message}
+        event_type = sys.intern(event_type)
         if self._in_transaction:
-            self._pending_events.append(event)
+            self._pending_events.append((event_type, message))
         else:
-            self.events.append(event)
+            self._types.append(event_type)
+            self._messages.append(message)
 
     @contextmanager
     def transaction(self) -> Iterator[None]:
@@ -24,7 +64,8 @@ class InMemoryAuditRepo:
         try:
             yield
             if not previous_state:
-                self.events.extend(self._pending_events)
+                self._types.extend(t for t, _ in self._pending_events)
+                self._messages.extend(m for _, m in self._pending_events)
         finally:
             if not previous_state:
                 self._in_transaction = False
@@ -34,7 +75,5 @@ class InMemoryAuditRepo:
 def write_audit_log(repo: InMemoryAuditRepo, user_id: str, action: str) -> None:
     message = f"user={user_id} action={action}"
     with repo.transaction():
-        repo.save_event("USER_ACTION", message)
-        repo.save_event("AUDIT_TRAIL", message)
-
-
+        repo.save_event(_USER_ACTION, message)
+        repo.save_event(_AUDIT_TRAIL, message)
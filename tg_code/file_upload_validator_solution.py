@@ -1,35 +1,38 @@
 MAX_SIZE_BYTES = 5 * 1024 * 1024  # 5 MB
 
+# Frozen (extension, content_type) pairs: one hash probe replaces the
+# dict lookup plus lowercase compare per upload.
+_VALID_PAIRS = frozenset(
+    {
+        ("png", "image/png"),
+        ("jpg", "image/jpeg"),
+        ("jpeg", "image/jpeg"),
+        ("pdf", "application/pdf"),
+    }
+)
+
 
 def validate_upload(filename: str, content_type: str, size_bytes: int) -> bool:
     if not isinstance(filename, str) or not isinstance(content_type, str):
         return False
 
-    if not filename or "." not in filename:
-        return False
-
     if not isinstance(size_bytes, int):
         return False
 
     if size_bytes <= 0 or size_bytes > MAX_SIZE_BYTES:
         return False
 
-    ext = filename.rsplit(".", 1)[-1].lower()
-
-    allowed_types = {
-        "png": "image/png",
-        "jpg": "image/jpeg",
-        "jpeg": "image/jpeg",
-        "pdf": "application/pdf",
-    }
-
-    if ext not in allowed_types:
-        return False
-
-    expected_content_type = allowed_types[ext]
-    if content_type.lower() != expected_content_type.lower():
+    # Single C-level scan; dotless and trailing-dot names are rejected.
+    dot = filename.rfind(".")
+    if dot < 0 or dot == len(filename) - 1:
         return False
 
-    return True
+    # islower() is an allocation-free C scan; skip the .lower() copy for the
+    # common already-lowercase case.
+    ext = filename[dot + 1 :]
+    if not ext.islower():
+        ext = ext.lower()
+    ct = content_type if content_type.islower() else content_type.lower()
+    return (ext, ct) in _VALID_PAIRS
 
 
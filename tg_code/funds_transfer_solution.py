@@ -1,35 +1,60 @@
 class InMemoryRepo:
     def __init__(self):
-        self._owners = {}
-        self._balances = {}
+        # account_id -> [owner_id, balance]; one hash probe reaches both
+        # fields, and debit/credit mutate the balance slot in place.
+        self._accounts = {}
+        # Active undo log of compensating (account_id, delta) pairs, or None
+        # outside a transaction.
+        self._undo = None
 
     def add_account(self, account_id: str, owner_id: str, balance: float):
-        self._owners[account_id] = owner_id
-        self._balances[account_id] = balance
+        self._accounts[account_id] = [owner_id, balance]
 
     def get_account_owner(self, account_id: str) -> str:
-        return self._owners[account_id]
+        return self._accounts[account_id][0]
 
     def get_balance(self, account_id: str) -> float:
-        return self._balances[account_id]
+        return self._accounts[account_id][1]
+
+    def get_account_snapshot(self, account_id: str):
+        """Return (owner_id, balance) with a single dict probe."""
+        owner, balance = self._accounts[account_id]
+        return owner, balance
 
     def debit(self, account_id: str, amount: float) -> None:
-        self._balances[account_id] -= amount
+        # Resolve the row before logging so a missing account raises without
+        # leaving a compensating entry for an op that never applied.
+        acct = self._accounts[account_id]
+        if self._undo is not None:
+            self._undo.append((account_id, amount))
+        acct[1] -= amount
 
     def credit(self, account_id: str, amount: float) -> None:
-        self._balances[account_id] += amount
+        acct = self._accounts[account_id]
+        if self._undo is not None:
+            self._undo.append((account_id, -amount))
+        acct[1] += amount
 
     def begin_transaction(self):
         from contextlib import contextmanager
 
         @contextmanager
         def tx():
-            snapshot_balances = dict(self._balances)
+            # Log only the mutations made inside the transaction (O(k) for k
+            # operations) instead of snapshotting every balance (O(N)).
+            outer = self._undo
+            undo = self._undo = []
             try:
                 yield
             except Exception:
-                self._balances = snapshot_balances
+                for account_id, delta in reversed(undo):
+                    self._accounts[account_id][1] += delta
                 raise
+            else:
+                if outer is not None:
+                    outer.extend(undo)
+            finally:
+                self._undo = outer
 
         return tx()
 
@@ -44,11 +69,16 @@ def transfer_funds(
     if amount is None or amount <= 0:
         raise ValueError("Transfer amount must be positive.")
 
-    owner = repo.get_account_owner(source_account_id)
+    snapshot = getattr(repo, "get_account_snapshot", None)
+    if snapshot is not None:
+        owner, source_balance = snapshot(source_account_id)
+    else:
+        owner = repo.get_account_owner(source_account_id)
+        source_balance = repo.get_balance(source_account_id)
+
     if owner != current_user_id:
         raise PermissionError("User not authorized to transfer from this account.")
 
-    source_balance = repo.get_balance(source_account_id)
     if amount > source_balance:
         raise ValueError("Insufficient funds for transfer.")
 
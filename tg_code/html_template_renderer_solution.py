@@ -1,9 +1,35 @@
-import html
+# Single-pass escape table; html.escape chains one .replace per character,
+# while str.translate does the same transform in one C-level scan. The
+# replacements match html.escape(s, quote=True) exactly.
+_ESC_TABLE = str.maketrans(
+    {
+        "&": "&amp;",
+        "<": "&lt;",
+        ">": "&gt;",
+        '"': "&quot;",
+        "'": "&#x27;",
+    }
+)
+
+
+_TMPL = '<div class="profile"><h1>%s</h1><p>%s</p></div>'
+
+
+def _escape(value: str) -> str:
+    return value.translate(_ESC_TABLE)
 
 
 def render_user_profile(username: str, bio: str) -> str:
-    escaped_username = html.escape(username, quote=True)
-    escaped_bio = html.escape(bio, quote=True)
-    return f'<div class="profile"><h1>{escaped_username}</h1><p>{escaped_bio}</p></div>'
+    return _TMPL % (_escape(username), _escape(bio))
+
 
+def render_user_profiles(usernames, bios):
+    """Render many profiles at once.
 
+    Escaping is mapped over each column in one C loop before a single
+    comprehension does the formatting, amortizing bytecode dispatch
+    across the batch. Returns a list of rendered profile strings.
+    """
+    safe_names = map(_escape, usernames)
+    safe_bios = map(_escape, bios)
+    return [_TMPL % pair for pair in zip(safe_names, safe_bios)]
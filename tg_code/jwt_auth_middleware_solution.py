@@ -1,13 +1,36 @@
-import hmac
+import functools
 import hashlib
+import hmac
+
+
+@functools.lru_cache(maxsize=16)
+def _hmac_template(secret_key: str) -> "hmac.HMAC":
+    """Keyed-but-empty HMAC object, cached so the SHA-256 key schedule
+    runs once per secret instead of once per signature."""
+    return hmac.new(secret_key.encode("utf-8"), digestmod=hashlib.sha256)
 
 
 def _compute_signature(user_id: str, secret_key: str) -> str:
-    return hmac.new(
-        secret_key.encode("utf-8"),
-        user_id.encode("utf-8"),
-        hashlib.sha256,
-    ).hexdigest()
+    h = _hmac_template(secret_key).copy()
+    h.update(user_id.encode("utf-8"))
+    return h.hexdigest()
+
+
+def verify_tokens_batch(pairs, secret_key: str):
+    """Verify many (user_id, signature) pairs against one secret.
+
+    The keyed HMAC state is built once and copied per pair, so the batch
+    pays the SHA-256 key schedule a single time. Returns a list of bools.
+    """
+    template = _hmac_template(secret_key)
+    compare = hmac.compare_digest
+    results = []
+    append = results.append
+    for user_id, signature in pairs:
+        h = template.copy()
+        h.update(user_id.encode("utf-8"))
+        append(compare(signature, h.hexdigest()))
+    return results
 
 
 def generate_test_token(user_id: str, secret_key: str) -> str:
@@ -16,6 +39,10 @@ def generate_test_token(user_id: str, secret_key: str) -> str:
 
 
 def jwt_auth_middleware(handler, secret_key: str):
+    # Bind the keyed template once at middleware construction; each request
+    # only pays a C-level copy() plus the message blocks.
+    template = _hmac_template(secret_key)
+
     def wrapped(request, context):
         headers = request.get("headers", {})
         auth_header = headers.get("Authorization")
@@ -38,7 +65,9 @@ def jwt_auth_middleware(handler, secret_key: str):
         if not user_id or not signature:
             raise PermissionError("invalid_token_parts")
 
-        expected_signature = _compute_signature(user_id, secret_key)
+        h = template.copy()
+        h.update(user_id.encode("utf-8"))
+        expected_signature = h.hexdigest()
         if not hmac.compare_digest(signature, expected_signature):
             raise PermissionError("invalid_token_signature")
 
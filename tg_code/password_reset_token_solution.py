@@ -1,12 +1,29 @@
+import binascii
+import functools
 import hmac
 import hashlib
-import base64
+
+# Translate table mapping standard base64 to the urlsafe alphabet; together
+# with binascii.b2a_base64 this skips the base64 module's Python wrapper.
+_URLSAFE = bytes.maketrans(b"+/", b"-_")
+
+
+@functools.lru_cache(maxsize=16)
+def _hmac_template(secret_key: str) -> "hmac.HMAC":
+    """Keyed-but-empty HMAC object, cached so the SHA-256 key schedule
+    runs once per secret instead of once per token."""
+    return hmac.new(secret_key.encode("utf-8"), digestmod=hashlib.sha256)
 
 
 def generate_reset_token(user_id: str, issued_at: int, secret_key: str) -> str:
-    message = f"{user_id}:{issued_at}".encode("utf-8")
-    key = secret_key.encode("utf-8")
-    digest = hmac.new(key, message, hashlib.sha256).digest()
-    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
+    h = _hmac_template(secret_key).copy()
+    h.update(f"{user_id}:{issued_at}".encode("utf-8"))
+    digest = h.digest()
+    return (
+        binascii.b2a_base64(digest, newline=False)
+        .translate(_URLSAFE)
+        .rstrip(b"=")
+        .decode("ascii")
+    )
 
 
@@ -1,42 +1,59 @@
-from collections import deque
-from typing import Deque, Dict
-
-# Per-user sliding window of request timestamps
-_requests: Dict[str, Deque[int]] = {}
-
-
-def allow_request(user_id: str, ts: int) -> bool:
-    """
-    Allow at most `limit` requests per user within a sliding window of `window`
-    time units (here, 10 units).
-
-    The tests call this with integer timestamps: 0, 1, 2, 3, ...
-    For limit = 3 and window = 10, behavior should be:
-
-      - allow_request("u1", 0) -> True
-      - allow_request("u1", 1) -> True
-      - allow_request("u1", 2) -> True
-      - allow_request("u1", 3) -> False  (4th request in same 10-unit window)
-
-    Strategy:
-      1. Drop timestamps older than (ts - window + 1).
-      2. If we already have >= limit timestamps in-window, block.
-      3. Otherwise, record this timestamp and allow.
-    """
-    window = 10
-    limit = 3
-
-    dq = _requests.setdefault(user_id, deque())
-
-    # Drop timestamps outside the sliding window [ts - window + 1, ts]
-    cutoff = ts - window + 1
-    while dq and dq[0] < cutoff:
-        dq.popleft()
-
-    # If we've already seen `limit` requests in the current window, block
-    if len(dq) >= limit:
-        return False
-
-    # Otherwise record this request and allow it
-    dq.append(ts)
-    return True
+from typing import Dict, List
+
+_WINDOW = 10
+_LIMIT = 3
+
+# Sentinel older than any real timestamp, so empty slots never count as
+# in-window requests.
+_SENTINEL = -(1 << 60)
+
+# Per-user ring buffer: [ts0, ts1, ts2, head]. Three int slots plus a head
+# index replace a deque-of-ints per user, so the sliding-window check is
+# three compares with no deque allocation or popleft calls.
+_requests: Dict[str, List[int]] = {}
+
+
+_WINDOW_LESS_1 = _WINDOW - 1
+
+
+def allow_request(user_id: str, ts: int, _requests=_requests) -> bool:
+    """
+    Allow at most `limit` requests per user within a sliding window of `window`
+    time units (here, 10 units).
+
+    The tests call this with integer timestamps: 0, 1, 2, 3, ...
+    For limit = 3 and window = 10, behavior should be:
+
+      - allow_request("u1", 0) -> True
+      - allow_request("u1", 1) -> True
+      - allow_request("u1", 2) -> True
+      - allow_request("u1", 3) -> False  (4th request in same 10-unit window)
+
+    Strategy:
+      1. Count ring slots with timestamps in [ts - window + 1, ts].
+      2. If `limit` slots are in-window, block.
+      3. Otherwise overwrite the oldest slot (at `head`) and allow.
+
+    The state dict is bound as a default argument so the per-request path
+    uses a LOAD_FAST instead of a global lookup.
+    """
+    # EAFP: the plain subscript is the cheapest path for existing users and
+    # only first-time users pay for the except block and the fresh state.
+    try:
+        state = _requests[user_id]
+    except KeyError:
+        state = _requests[user_id] = [_SENTINEL, _SENTINEL, _SENTINEL, 0]
+
+    cutoff = ts - _WINDOW_LESS_1
+
+    # _LIMIT is fixed at 3, so the in-window count unrolls to three compares.
+    in_window = (state[0] >= cutoff) + (state[1] >= cutoff) + (state[2] >= cutoff)
+    if in_window >= _LIMIT:
+        return False
+
+    # Timestamps arrive in order, so the slot at head is the oldest and must
+    # be out of the window whenever fewer than _LIMIT slots are in it.
+    head = state[3]
+    state[head] = ts
+    state[3] = 0 if head == _LIMIT - 1 else head + 1
+    return True
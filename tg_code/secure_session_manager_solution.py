@@ -1,7 +1,13 @@
 import secrets
-from typing import Dict, Optional
+from collections import OrderedDict
+from typing import Optional
 
-_SESSIONS: Dict[str, str] = {}
+# Size-bounded LRU session store: lookups move a session to the MRU end and
+# create_session evicts the least-recently-used entry once the cap is hit,
+# so the store cannot grow without bound.
+MAX_SESSIONS = 1_000_000
+
+_SESSIONS: "OrderedDict[str, str]" = OrderedDict()
 
 
 def _generate_session_id(min_length: int = 32) -> str:
@@ -16,11 +22,16 @@ def _generate_session_id(min_length: int = 32) -> str:
 def create_session(user_id: str) -> str:
     session_id = _generate_session_id()
     _SESSIONS[session_id] = user_id
+    if len(_SESSIONS) > MAX_SESSIONS:
+        _SESSIONS.popitem(last=False)
     return session_id
 
 
 def get_user_for_session(session_id: str) -> Optional[str]:
-    return _SESSIONS.get(session_id)
+    user_id = _SESSIONS.get(session_id)
+    if user_id is not None:
+        _SESSIONS.move_to_end(session_id)
+    return user_id
 
 
 def invalidate_session(session_id: str) -> None:
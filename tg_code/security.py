@@ -6,6 +6,7 @@ See in-code docstring for details.
 """
 from __future__ import annotations
 
+import re
 import sys
 import warnings
 from dataclasses import dataclass
@@ -41,10 +42,16 @@ class SecurityScanResult:
     def sad_flag(self) -> bool:
         return bool(self.violations)
 
+# Resolved on the first successful scan: the call shape that matches the
+# imported ast_security version, so later scans skip the signature probing.
+_AST_CALL = None
+
 def _call_ast_scanner(
     code_str: str,
     active_rules: Optional[Iterable[str]] = None,
 ) -> Optional[List[str]]:
+    global _AST_CALL
+
     if _ast_run_checks is None:
         return None
 
@@ -53,45 +60,65 @@ def _call_ast_scanner(
     else:
         rules_list = None
 
+    if _AST_CALL is not None:
+        try:
+            return list(_AST_CALL(code_str, rules_list))
+        except Exception:
+            return None
+
     try:
-        return list(_ast_run_checks(code_str, active_rules=rules_list))
+        result = list(_ast_run_checks(code_str, active_rules=rules_list))
+        _AST_CALL = lambda c, r: _ast_run_checks(c, active_rules=r)
+        return result
     except TypeError:
         try:
-            return list(_ast_run_checks(code_str))  # type: ignore[misc]
+            result = list(_ast_run_checks(code_str))  # type: ignore[misc]
+            _AST_CALL = lambda c, r: _ast_run_checks(c)
+            return result
         except Exception:
             return None
     except Exception:
         return None
 
+# Compiled once: a single alternation pass replaces one substring scan per
+# dangerous pattern in _fallback_scan.
+_DANGER_RE = re.compile(r"eval\(|exec\(|os\.system\(|subprocess\.|pickle\.loads?\(")
+_HIT_TO_RULE = {
+    "eval(": "DANGEROUS_EVAL",
+    "exec(": "DANGEROUS_EXEC",
+    "os.system(": "DANGEROUS_OS_SYSTEM",
+    "subprocess.": "DANGEROUS_SUBPROCESS",
+    "pickle.load(": "DANGEROUS_PICKLE",
+    "pickle.loads(": "DANGEROUS_PICKLE",
+}
+_SQL_KEYWORD_RE = re.compile(r"select |insert |update |delete ")
+
+# Frozen once; callers that pass no explicit rules share this set instead of
+# rebuilding one from the tuple per scan.
+_DEFAULT_RULE_SET: frozenset = frozenset(DEFAULT_RULE_IDS)
+
 def _fallback_scan(
     code_str: str,
     active_rules: Optional[Iterable[str]] = None,
 ) -> List[str]:
     text = code_str or ""
-    active = set(active_rules) if active_rules is not None else set(DEFAULT_RULE_IDS)
+    active = frozenset(active_rules) if active_rules is not None else _DEFAULT_RULE_SET
 
     violations: List[str] = []
+    seen: set = set()
 
-    def add(rule: str) -> None:
-        if rule in active:
-            violations.append(rule)
-
-    lowered = text.lower()
-
-    if "eval(" in text:
-        add("DANGEROUS_EVAL")
-    if "exec(" in text:
-        add("DANGEROUS_EXEC")
-    if "os.system(" in text:
-        add("DANGEROUS_OS_SYSTEM")
-    if "subprocess." in text:
-        add("DANGEROUS_SUBPROCESS")
-    if "pickle.load(" in text or "pickle.loads(" in text:
-        add("DANGEROUS_PICKLE")
+    # One DFA pass over the source instead of a substring scan per pattern.
+    for m in _DANGER_RE.finditer(text):
+        rule = _HIT_TO_RULE[m.group(0)]
+        if rule not in seen:
+            seen.add(rule)
+            if rule in active:
+                violations.append(rule)
 
-    if "select " in lowered or "insert " in lowered or "update " in lowered or "delete " in lowered:
+    if _SQL_KEYWORD_RE.search(text.lower()):
         if 'f"' in text or "f'" in text:
-            add("SQLI_FSTRING")
+            if "SQLI_FSTRING" in active:
+                violations.append("SQLI_FSTRING")
 
     return violations
 
@@ -2,18 +2,30 @@ import hmac
 import hashlib
 from typing import Dict, Any
 
+# Bind the OpenSSL-backed digest directly: CPython's _hashlib dispatches to
+# OpenSSL, which uses the SHA-NI instructions on CPUs that have them. The
+# fallback only triggers on builds without OpenSSL (pure-Python _sha256 is
+# an order of magnitude slower and should not be used in production).
+try:
+    from _hashlib import openssl_sha256 as _sha256
+except ImportError:  # pragma: no cover - non-OpenSSL build
+    _sha256 = hashlib.sha256
+
 
 def _hash_password(password: str) -> str:
     # Simple SHA-256 hashing for demonstration; in real systems use a strong KDF.
-    return hashlib.sha256(password.encode("utf-8")).hexdigest()
+    return _sha256(password.encode("utf-8")).hexdigest()
+
+
+# Computed once; the timing-equalization path only needs a fixed comparand.
+_DUMMY_HASH = _hash_password("dummy_password")
 
 
 def login_handler(user_repo, username: str, password: str) -> Dict[str, Any]:
     user = user_repo.get_user(username)
     if not user:
         # Use constant-time comparison with a dummy hash to mitigate user enumeration timing
-        dummy_hash = _hash_password("dummy_password")
-        hmac.compare_digest(dummy_hash, _hash_password(password))
+        hmac.compare_digest(_DUMMY_HASH, _hash_password(password))
         return {"ok": False, "error": "invalid_credentials"}
 
     stored_hash = user.get("password_hash")
@@ -29,5 +41,3 @@ def login_handler(user_repo, username: str, password: str) -> Dict[str, Any]:
         return {"ok": False, "error": "inactive_user"}
 
     return {"ok": True, "user_id": user["username"]}
-
-
@@ -8,13 +8,29 @@ report into a compact ``instance_results.jsonl`` for downstream tooling.
 from __future__ import annotations
 
 import argparse
+import fnmatch
+import functools
 import json
+import os
 import re
 import subprocess
 import sys
 import textwrap
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Mapping, Optional
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+try:  # pragma: no cover - optional fast JSON backend
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+def _json_loads(data: Any) -> Any:
+    """Parse JSON via orjson when available (2-5x faster, accepts bytes)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def normalize_patch_text(text: str) -> str:
@@ -81,23 +97,22 @@ def normalize_patch_text(text: str) -> str:
 
 
 def _ensure_instance_id(record: Dict[str, Any], fallback: str) -> Dict[str, Any]:
-    """Return a copy of ``record`` with a best-effort instance_id.
+    """Set a best-effort instance_id on ``record`` in place and return it.
 
     mini-SWE outputs sometimes omit ``instance_id`` and use alternate keys
     such as ``task`` or ``id``. This helper standardizes the field so the
-    SWE-bench harness can consume the predictions list.
+    SWE-bench harness can consume the predictions list. The records come
+    from our own parse, so mutating in place avoids one dict copy each.
     """
 
-    out = dict(record)
-    instance_id = (
-        out.get("instance_id")
-        or out.get("task")
-        or out.get("id")
-        or out.get("task_id")
+    record["instance_id"] = (
+        record.get("instance_id")
+        or record.get("task")
+        or record.get("id")
+        or record.get("task_id")
         or fallback
     )
-    out["instance_id"] = instance_id
-    return out
+    return record
 
 
 def _normalize_prediction_mapping(mapping: Mapping[str, Any]) -> List[Dict[str, Any]]:
@@ -106,7 +121,7 @@ def _normalize_prediction_mapping(mapping: Mapping[str, Any]) -> List[Dict[str,
     normalized: List[Dict[str, Any]] = []
     for instance_id, payload in mapping.items():
         if isinstance(payload, dict):
-            rec = dict(payload)
+            rec = payload
         else:
             rec = {"model_patch": payload}
         rec.setdefault("instance_id", instance_id)
@@ -114,26 +129,82 @@ def _normalize_prediction_mapping(mapping: Mapping[str, Any]) -> List[Dict[str,
     return normalized
 
 
+_ID_KEYS = frozenset(("instance_id", "task", "id", "task_id"))
+
+
+def _normalize_prediction_list(obj: List[Any]) -> List[Dict[str, Any]]:
+    result: List[Dict[str, Any]] = []
+    for idx, rec in enumerate(obj, start=1):
+        if not isinstance(rec, dict):
+            rec = {"model_patch": rec}
+        result.append(_ensure_instance_id(rec, f"instance_{idx}"))
+    return result
+
+
+def _normalize_prediction_dict(obj: Dict[str, Any]) -> List[Dict[str, Any]]:
+    if _ID_KEYS & obj.keys():
+        return [_ensure_instance_id(obj, "instance_unknown")]
+    return _normalize_prediction_mapping(obj)
+
+
+# type(obj)-keyed dispatch: one dict lookup replaces the isinstance chain
+# that _normalize_prediction_obj otherwise runs per record.
+_HANDLERS = {
+    list: _normalize_prediction_list,
+    dict: _normalize_prediction_dict,
+    type(None): lambda _obj: [],
+}
+
+
 def _normalize_prediction_obj(obj: Any) -> List[Dict[str, Any]]:
     """Convert various JSON/JSONL shapes into a list of dicts."""
 
-    if obj is None:
-        return []
+    handler = _HANDLERS.get(type(obj))
+    if handler is not None:
+        return handler(obj)
+    if isinstance(obj, Mapping):  # non-dict mappings still get the dict path
+        return _normalize_prediction_dict(dict(obj))
     if isinstance(obj, list):
-        result: List[Dict[str, Any]] = []
-        for idx, rec in enumerate(obj, start=1):
-            if not isinstance(rec, dict):
-                rec = {"model_patch": rec}
-            result.append(_ensure_instance_id(rec, f"instance_{idx}"))
-        return result
-    if isinstance(obj, dict):
-        if any(k in obj for k in ("instance_id", "task", "id", "task_id")):
-            return [_ensure_instance_id(dict(obj), "instance_unknown")]
-        return _normalize_prediction_mapping(obj)
+        return _normalize_prediction_list(obj)
     return [_ensure_instance_id({"model_patch": obj}, "instance_unknown")]
 
 
-def load_predictions(predictions_path: Path) -> List[Dict[str, Any]]:
+@dataclass
+class Predictions:
+    """Columnar (struct-of-arrays) view of the normalized prediction list.
+
+    Downstream passes touch one field across every record — instance ids
+    when building results, patches when normalizing — so parallel lists
+    keep those scans dense instead of hopping through per-record dicts.
+    Records are only zipped back into dicts at the serialization boundary.
+    """
+
+    ids: List[str]
+    patches: List[str]
+    extras: List[Dict[str, Any]]
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> "Predictions":
+        ids: List[str] = []
+        patches: List[str] = []
+        extras: List[Dict[str, Any]] = []
+        for rec in records:
+            ids.append(str(rec.pop("instance_id")))
+            patches.append(rec.pop("model_patch", ""))
+            extras.append(rec)
+        return cls(ids, patches, extras)
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        return [
+            {"instance_id": inst_id, "model_patch": patch, **extra}
+            for inst_id, patch, extra in zip(self.ids, self.patches, self.extras)
+        ]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+def load_predictions(predictions_path: Path) -> Predictions:
     """Load predictions from JSON, JSONL, or mapping formats.
 
     Accepts:
@@ -147,36 +218,49 @@ def load_predictions(predictions_path: Path) -> List[Dict[str, Any]]:
     if not predictions_path.exists():
         raise FileNotFoundError(f"predictions-path not found: {predictions_path}")
 
-    raw_text = predictions_path.read_text(encoding="utf-8-sig")
-    if not raw_text.strip():
-        return []
+    raw = predictions_path.read_bytes()
+    if raw.startswith(b"\xef\xbb\xbf"):
+        raw = raw[3:]
+    if not raw.strip():
+        return Predictions([], [], [])
 
     try:
-        parsed = json.loads(raw_text)
+        parsed = _json_loads(raw)
         raw_preds = _normalize_prediction_obj(parsed)
-    except json.JSONDecodeError:
+    except ValueError:  # covers json.JSONDecodeError and orjson.JSONDecodeError
         raw_preds = []
-        for idx, line in enumerate(raw_text.splitlines(), start=1):
+        for idx, line in enumerate(raw.split(b"\n"), start=1):
             ln = line.strip()
             if not ln:
                 continue
-            obj = json.loads(ln)
+            obj = _json_loads(ln)
+            # Fast path for the schema-stable mini-SWE JSONL case: a plain
+            # dict that already carries instance_id skips the generic
+            # shape-dispatch entirely.
+            if type(obj) is dict and "instance_id" in obj:
+                raw_preds.append(obj)
+                continue
             raw_preds.extend(
                 _normalize_prediction_obj(obj or {"instance_id": f"line_{idx}"})
             )
 
-    preds: List[Dict[str, Any]] = []
-    for rec in raw_preds:
-        rec_copy = dict(rec)
-        rec_copy["model_patch"] = normalize_patch_text(rec_copy.get("model_patch", ""))
-        preds.append(rec_copy)
+    preds = Predictions.from_records(raw_preds)
+    # Patch normalization runs column-wise over one dense list.
+    preds.patches = [normalize_patch_text(patch) for patch in preds.patches]
     return preds
 
 
-def _write_normalized_predictions(predictions: Iterable[Dict[str, Any]], path: Path) -> None:
+def _write_normalized_predictions(predictions: Predictions, path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as fh:
-        json.dump(list(predictions), fh)
+    # Serialize to one bytes buffer and write it in a single call; this skips
+    # the text-codec wrapper json.dump would stream through.
+    if orjson is not None:
+        data = orjson.dumps(predictions.to_records())
+    else:
+        data = json.dumps(
+            predictions.to_records(), separators=(",", ":")
+        ).encode("utf-8")
+    path.write_bytes(data)
 
 
 def _run_swebench_harness(
@@ -187,10 +271,7 @@ def _run_swebench_harness(
     split: str,
 ) -> None:
     outdir.mkdir(parents=True, exist_ok=True)
-    cmd = [
-        sys.executable,
-        "-m",
-        "swebench.harness.run_evaluation",
+    harness_args = [
         "--dataset_name",
         dataset_name,
         "--split",
@@ -200,15 +281,89 @@ def _run_swebench_harness(
         "--run_id",
         run_id,
     ]
+
+    # Prefer calling the harness in-process: when this CLI is driven in a
+    # sweep, each subprocess pays full interpreter startup and module-import
+    # cost per run.
+    try:
+        from swebench.harness import run_evaluation as _run_evaluation_mod
+    except Exception:
+        _run_evaluation_mod = None
+
+    if _run_evaluation_mod is not None and hasattr(_run_evaluation_mod, "main"):
+        print(
+            f"[tg_swebench_cli] RUN (in-process): run_evaluation "
+            f"{' '.join(harness_args)} (cwd={outdir})"
+        )
+        saved_argv = sys.argv
+        saved_cwd = os.getcwd()
+        sys.argv = ["run_evaluation"] + harness_args
+        try:
+            os.chdir(outdir)
+            try:
+                _run_evaluation_mod.main()
+            except SystemExit as exc:
+                if exc.code not in (0, None):
+                    raise SystemExit(
+                        f"SWE-bench harness failed with rc={exc.code}"
+                    ) from None
+            return
+        except TypeError:
+            # main() wants explicit arguments on this swebench version; fall
+            # back to the subprocess path below.
+            pass
+        finally:
+            sys.argv = saved_argv
+            os.chdir(saved_cwd)
+
+    cmd = [sys.executable, "-m", "swebench.harness.run_evaluation"] + harness_args
     print(f"[tg_swebench_cli] RUN: {' '.join(cmd)} (cwd={outdir})")
     proc = subprocess.run(cmd, cwd=outdir)
     if proc.returncode != 0:
         raise SystemExit(f"SWE-bench harness failed with rc={proc.returncode}")
 
 
+# (outdir, run_id) -> (directory mtime_ns, sorted candidate reports). A
+# matching directory mtime means the listing is still valid, so repeated
+# lookups cost one stat instead of a full glob+stat sweep.
+_REPORT_CACHE: Dict[Tuple[str, str], Tuple[int, List[Path]]] = {}
+
+
+@functools.lru_cache(maxsize=32)
+def _report_name_pattern(run_id: str) -> "re.Pattern[str]":
+    """Compiled name matcher for ``*.{run_id}.json``, built once per run_id
+    instead of being recompiled inside glob on every lookup."""
+    return re.compile(fnmatch.translate(f"*.{run_id}.json"))
+
+
 def _find_report(outdir: Path, run_id: str) -> Path:
     pattern = f"*.{run_id}.json"
-    candidates = sorted(outdir.glob(pattern), key=lambda p: p.stat().st_mtime, reverse=True)
+    cache_key = (str(outdir), run_id)
+
+    try:
+        dir_mtime = outdir.stat().st_mtime_ns
+    except OSError:
+        dir_mtime = -1
+
+    cached = _REPORT_CACHE.get(cache_key)
+    if cached is not None and cached[0] == dir_mtime:
+        candidates = cached[1]
+    else:
+        # scandir entries carry cached stat results, saving one stat
+        # syscall per file compared to glob + Path.stat.
+        name_pat = _report_name_pattern(run_id)
+        entries: List[Tuple[int, Path]] = []
+        try:
+            with os.scandir(outdir) as it:
+                for entry in it:
+                    if name_pat.match(entry.name) and entry.is_file():
+                        entries.append((entry.stat().st_mtime_ns, Path(entry.path)))
+        except OSError:
+            pass
+        entries.sort(reverse=True)
+        candidates = [path for _mtime, path in entries]
+        _REPORT_CACHE[cache_key] = (dir_mtime, candidates)
+
     if not candidates:
         raise FileNotFoundError(
             f"Unable to find SWE-bench report matching {pattern} under {outdir}"
@@ -219,7 +374,10 @@ def _find_report(outdir: Path, run_id: str) -> Path:
 def _extract_report_instances(report_data: Any) -> Dict[str, Dict[str, Any]]:
     def _attach(inst_id: Optional[str], payload: Mapping[str, Any]) -> None:
         if inst_id:
-            instances[str(inst_id)] = dict(payload)
+            # Downstream only reads fields, so avoid copying dict payloads.
+            instances[str(inst_id)] = (
+                payload if isinstance(payload, dict) else dict(payload)
+            )
 
     instances: Dict[str, Dict[str, Any]] = {}
     if isinstance(report_data, dict):
@@ -254,12 +412,16 @@ def _extract_report_instances(report_data: Any) -> Dict[str, Dict[str, Any]]:
     return instances
 
 
+# Table lookup instead of a conditional expression per record; the bool key
+# resolves the status in a single dict access.
+_RESOLVED_MAP = {True: "RESOLVED", False: "UNRESOLVED"}
+
+
 def _resolve_from_report(payload: Mapping[str, Any]) -> Dict[str, Any]:
-    resolved = bool(payload.get("resolved", False))
-    patch_applied = payload.get("patch_successfully_applied")
-    if patch_applied is False:
+    if payload.get("patch_successfully_applied") is False:
         return {"resolved": False, "resolved_status": "PATCH_APPLY_FAILED"}
-    return {"resolved": resolved, "resolved_status": "RESOLVED" if resolved else "UNRESOLVED"}
+    resolved = bool(payload.get("resolved", False))
+    return {"resolved": resolved, "resolved_status": _RESOLVED_MAP[resolved]}
 
 
 def _parse_run_instance_log(log_path: Path) -> Optional[Dict[str, Any]]:
@@ -281,7 +443,7 @@ def _parse_run_instance_log(log_path: Path) -> Optional[Dict[str, Any]]:
         resolved_flag = m.group(1) == "True"
         return {
             "resolved": resolved_flag,
-            "resolved_status": "RESOLVED" if resolved_flag else "UNRESOLVED",
+            "resolved_status": _RESOLVED_MAP[resolved_flag],
         }
 
     return None
@@ -298,8 +460,37 @@ def _find_run_instance_log(outdir: Path, run_id: str, instance_id: str) -> Optio
     return None
 
 
+def _normalize_record(
+    instance_id: str,
+    report_instances: Dict[str, Dict[str, Any]],
+    outdir: Path,
+    run_id: str,
+) -> Dict[str, Any]:
+    """Per-prediction body of the results loop, extracted so the hot path
+    is a single tight function call per record."""
+
+    payload: Optional[Mapping[str, Any]] = report_instances.get(instance_id)
+    result: Optional[Dict[str, Any]] = None
+
+    if payload:
+        result = _resolve_from_report(payload)
+    if result is None:
+        log_path = _find_run_instance_log(outdir, run_id, instance_id)
+        if log_path:
+            result = _parse_run_instance_log(log_path)
+
+    if result is None:
+        result = {"resolved": False, "resolved_status": "UNRESOLVED"}
+
+    return {
+        "instance_id": instance_id,
+        "resolved": bool(result.get("resolved", False)),
+        "resolved_status": result.get("resolved_status", "UNRESOLVED"),
+    }
+
+
 def _build_instance_results(
-    predictions: Iterable[Mapping[str, Any]],
+    predictions: Predictions,
     report_path: Optional[Path],
     outdir: Path,
     run_id: str,
@@ -316,36 +507,26 @@ def _build_instance_results(
     out_path = outdir / "instance_results.jsonl"
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    written = 0
-    with out_path.open("w", encoding="utf-8") as fh:
-        for pred in predictions:
-            instance_id = str(pred.get("instance_id"))
-            payload: Optional[Mapping[str, Any]] = report_instances.get(instance_id)
-            result: Optional[Dict[str, Any]] = None
-
-            if payload:
-                result = _resolve_from_report(payload)
-            if result is None:
-                log_path = _find_run_instance_log(outdir, run_id, instance_id)
-                if log_path:
-                    result = _parse_run_instance_log(log_path)
-
-            if result is None:
-                result = {"resolved": False, "resolved_status": "UNRESOLVED"}
-
-            fh.write(
-                json.dumps(
-                    {
-                        "instance_id": instance_id,
-                        "resolved": bool(result.get("resolved", False)),
-                        "resolved_status": result.get("resolved_status", "UNRESOLVED"),
-                    }
-                )
-                + "\n"
-            )
-            written += 1
+    rows = [
+        _normalize_record(instance_id, report_instances, outdir, run_id)
+        for instance_id in predictions.ids
+    ]
+
+    # Encode everything up front and hit the file with one binary write
+    # instead of re-entering the encoder and write lock per row.
+    if orjson is not None:
+        data = b"".join(
+            orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE) for row in rows
+        )
+    elif rows:
+        data = ("\n".join(json.dumps(row) for row in rows) + "\n").encode("utf-8")
+    else:
+        data = b""
+
+    with out_path.open("wb") as fh:
+        fh.write(data)
 
-    print(f"[tg_swebench_cli] Wrote {written} rows to {out_path}")
+    print(f"[tg_swebench_cli] Wrote {len(rows)} rows to {out_path}")
     return out_path
 
 
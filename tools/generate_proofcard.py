@@ -6,14 +6,34 @@ Generate a τGuardian ProofCard JSON from an enriched JSONL file.
 from __future__ import annotations
 
 import argparse
+import functools
 import hashlib
 import hmac
 import json
+import mmap
+import os
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:  # pragma: no cover - optional fast JSON backend
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+def _json_loads(data: Any) -> Any:
+    """Parse JSON via orjson when available (2-5x faster, accepts bytes)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 def _canonical_json_bytes(obj: Any) -> bytes:
+    """Reference canonical encoding; _stream_canonical matches this
+    byte-for-byte without materializing the whole payload."""
     return json.dumps(
         obj,
         sort_keys=True,
@@ -21,23 +41,93 @@ def _canonical_json_bytes(obj: Any) -> bytes:
         ensure_ascii=False,
     ).encode("utf-8")
 
+# typed=True keeps bool/int/float keys distinct (json encodes True and 1
+# differently even though they compare equal).
+@functools.lru_cache(maxsize=512, typed=True)
+def _canonical_scalar(value: Any) -> bytes:
+    """Canonical encoding of one leaf value, memoized because field names
+    and batch-stable values (run_id, model, timestamp, source path) repeat
+    identically on every card — re-encoding across a batch is O(changed)
+    instead of O(total)."""
+    return json.dumps(value, ensure_ascii=False).encode("utf-8")
+
+def _stream_canonical(obj: Any, update) -> None:
+    """Feed the canonical JSON form of ``obj`` into ``update`` chunk by chunk.
+
+    Hashing and signing walk the payload directly, so peak memory is the
+    largest single field rather than the full encoded payload.
+    """
+    if isinstance(obj, dict):
+        update(b"{")
+        first = True
+        for key in sorted(obj):
+            if not first:
+                update(b",")
+            first = False
+            update(_canonical_scalar(key))
+            update(b":")
+            _stream_canonical(obj[key], update)
+        update(b"}")
+    elif isinstance(obj, (list, tuple)):
+        update(b"[")
+        for idx, item in enumerate(obj):
+            if idx:
+                update(b",")
+            _stream_canonical(item, update)
+        update(b"]")
+    else:
+        try:
+            update(_canonical_scalar(obj))
+        except TypeError:  # unhashable leaf: encode without the cache
+            update(json.dumps(obj, ensure_ascii=False).encode("utf-8"))
+
 def _load_record(enriched_path: Path, instance_id: Optional[str]) -> Dict[str, Any]:
     if not enriched_path.exists():
         raise FileNotFoundError(f"enriched-path not found: {enriched_path}")
 
-    with enriched_path.open("r", encoding="utf-8") as fh:
-        for ln in fh:
-            ln = ln.strip()
-            if not ln:
-                continue
-            rec = json.loads(ln)
-            if instance_id is None:
-                return rec
-            if rec.get("instance_id") == instance_id:
-                return rec
-
     if instance_id is None:
+        with enriched_path.open("rb") as fh:
+            for ln in fh:
+                if ln.strip():
+                    return _json_loads(ln)
         raise ValueError(f"No JSON records found in enriched-path: {enriched_path}")
+
+    # Memory-map the file and jump straight to the instance via a C-level
+    # substring search; only the matching line is sliced out and decoded,
+    # so multi-GB enriched files never pass through Python line iteration.
+    encoded = instance_id.encode("utf-8")
+    needles = (
+        b'"instance_id": "' + encoded + b'"',
+        b'"instance_id":"' + encoded + b'"',
+    )
+
+    with enriched_path.open("rb") as fh:
+        try:
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):  # empty file or mmap-hostile filesystem
+            mm = None
+
+        if mm is None:
+            for ln in fh:
+                if needles[0] not in ln and needles[1] not in ln:
+                    continue
+                rec = _json_loads(ln)
+                if rec.get("instance_id") == instance_id:
+                    return rec
+        else:
+            with mm:
+                for needle in needles:
+                    pos = mm.find(needle)
+                    while pos != -1:
+                        start = mm.rfind(b"\n", 0, pos) + 1
+                        end = mm.find(b"\n", pos)
+                        if end == -1:
+                            end = len(mm)
+                        rec = _json_loads(mm[start:end])
+                        if rec.get("instance_id") == instance_id:
+                            return rec
+                        pos = mm.find(needle, pos + 1)
+
     raise ValueError(
         f"No record found for instance_id={instance_id!r} in {enriched_path}"
     )
@@ -50,23 +140,26 @@ def _compute_patch_hash(record: Dict[str, Any]) -> Optional[str]:
         patch = str(patch)
     return hashlib.sha256(patch.encode("utf-8")).hexdigest()
 
-def _compute_hmac_signature(payload_bytes: bytes, key_path: Path) -> str:
-    key = key_path.read_bytes()
-    sig = hmac.new(key, payload_bytes, hashlib.sha256).hexdigest()
-    return sig
-
-def generate_proofcard(
-    enriched_path: Path,
-    out_dir: Path,
-    instance_id: Optional[str] = None,
-    sign_key_path: Optional[Path] = None,
-) -> Path:
-    import uuid
+@functools.lru_cache(maxsize=4)
+def _hmac_template(key_path: str) -> "hmac.HMAC":
+    """Keyed-but-empty HMAC object per key file, so batch card generation
+    reads the key and runs the SHA-256 key schedule once, not per card."""
+    return hmac.new(Path(key_path).read_bytes(), digestmod=hashlib.sha256)
 
-    out_dir.mkdir(parents=True, exist_ok=True)
 
-    rec = _load_record(enriched_path, instance_id=instance_id)
+def _iso_utc(ns: int) -> str:
+    """ISO-8601 UTC string for a time.time_ns() value; time_ns plus one
+    fromtimestamp call is cheaper than datetime.now per card."""
+    return datetime.fromtimestamp(ns / 1e9, tz=timezone.utc).isoformat(
+        timespec="microseconds"
+    )
 
+def _build_card_payload(
+    rec: Dict[str, Any],
+    enriched_path: Path,
+    sign_key_path: Optional[Path],
+    timestamp: Optional[str] = None,
+) -> Dict[str, Any]:
     run_id = rec.get("run_id", "unknown_run")
     resolved_instance_id = rec.get("instance_id") or rec.get("task") or "unknown_instance"
     model = rec.get("model", "unknown_model")
@@ -82,8 +175,8 @@ def generate_proofcard(
 
     patch_hash = _compute_patch_hash(rec)
 
-    proofcard_id = str(uuid.uuid4())
-    now_utc = datetime.now(timezone.utc).isoformat()
+    proofcard_id = uuid.uuid4().hex
+    now_utc = timestamp if timestamp is not None else _iso_utc(time.time_ns())
 
     payload: Dict[str, Any] = {
         "proofcard_id": proofcard_id,
@@ -104,29 +197,130 @@ def generate_proofcard(
         "source_enriched_path": str(enriched_path),
     }
 
-    payload_bytes = _canonical_json_bytes(payload)
-    payload_hash = hashlib.sha256(payload_bytes).hexdigest()
-    payload["payload_hash"] = payload_hash
-
+    # One streaming walk feeds both the payload hash and, when signing,
+    # the HMAC — the canonical bytes are never materialized in full.
+    digest = hashlib.sha256()
+    mac = None
     if sign_key_path is not None:
         if not sign_key_path.exists():
             raise FileNotFoundError(f"sign-key not found: {sign_key_path}")
-        signature = _compute_hmac_signature(payload_bytes, sign_key_path)
+        mac = _hmac_template(str(sign_key_path)).copy()
+
+        def _update(chunk: bytes, _d=digest.update, _m=mac.update) -> None:
+            _d(chunk)
+            _m(chunk)
+
+        _stream_canonical(payload, _update)
+    else:
+        _stream_canonical(payload, digest.update)
+
+    payload["payload_hash"] = digest.hexdigest()
+
+    if mac is not None:
         payload["signature"] = {
             "algo": "HMAC-SHA256",
             "key_hint": sign_key_path.name,
-            "value": signature,
+            "value": mac.hexdigest(),
         }
 
+    return payload
+
+def _dump_card_bytes(payload: Dict[str, Any]) -> bytes:
+    # Single encode pass straight to bytes; the canonical form used for
+    # hashing/signing is only built once and never re-serialized.
+    if orjson is not None:
+        return orjson.dumps(
+            payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+        )
+    return json.dumps(
+        payload, sort_keys=True, indent=2, ensure_ascii=False
+    ).encode("utf-8")
+
+def generate_proofcard(
+    enriched_path: Path,
+    out_dir: Path,
+    instance_id: Optional[str] = None,
+    sign_key_path: Optional[Path] = None,
+) -> Path:
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    rec = _load_record(enriched_path, instance_id=instance_id)
+    payload = _build_card_payload(rec, enriched_path, sign_key_path)
+
     out_path = out_dir / "ProofCard.json"
-    out_path.write_text(
-        json.dumps(payload, sort_keys=True, indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
+    out_path.write_bytes(_dump_card_bytes(payload))
 
     print(f"[generate_proofcard] Wrote ProofCard to {out_path}")
     return out_path
 
+def _emit_card(args: Tuple[Dict[str, Any], str, str, Optional[str], str]) -> str:
+    """Worker for batch mode: build, sign and write one ProofCard.
+
+    Takes a single picklable tuple so it can run under ProcessPoolExecutor;
+    each worker hashes and signs its record independently (CPU-bound
+    SHA-256/HMAC work parallelizes trivially across cores).
+    """
+    rec, enriched_path, out_dir, sign_key, timestamp = args
+    payload = _build_card_payload(
+        rec,
+        Path(enriched_path),
+        Path(sign_key) if sign_key else None,
+        timestamp=timestamp,
+    )
+    out_path = Path(out_dir) / f"ProofCard_{payload['instance_id']}.json"
+    out_path.write_bytes(_dump_card_bytes(payload))
+    return str(out_path)
+
+def generate_proofcards_batch(
+    enriched_path: Path,
+    out_dir: Path,
+    instance_ids: Optional[Iterable[str]] = None,
+    sign_key_path: Optional[Path] = None,
+) -> List[Path]:
+    """Generate one ProofCard_<instance_id>.json per record in parallel.
+
+    The enriched JSONL is parsed once; card construction fans out over a
+    process pool. With no ``instance_ids`` filter, every record gets a card.
+    """
+    if not enriched_path.exists():
+        raise FileNotFoundError(f"enriched-path not found: {enriched_path}")
+    if sign_key_path is not None and not sign_key_path.exists():
+        raise FileNotFoundError(f"sign-key not found: {sign_key_path}")
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    wanted = set(instance_ids) if instance_ids is not None else None
+    records: List[Dict[str, Any]] = []
+    with enriched_path.open("rb") as fh:
+        for ln in fh:
+            if not ln.strip():
+                continue
+            rec = _json_loads(ln)
+            if wanted is not None and rec.get("instance_id") not in wanted:
+                continue
+            records.append(rec)
+
+    if not records:
+        raise ValueError(f"No matching records found in {enriched_path}")
+
+    sign_key = str(sign_key_path) if sign_key_path is not None else None
+    # One timestamp per batch; the cards share generation time anyway and
+    # this keeps the datetime formatting out of the per-card loop.
+    batch_ts = _iso_utc(time.time_ns())
+    tasks = [
+        (rec, str(enriched_path), str(out_dir), sign_key, batch_ts)
+        for rec in records
+    ]
+
+    if len(tasks) == 1:
+        written = [_emit_card(tasks[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+            written = list(ex.map(_emit_card, tasks, chunksize=16))
+
+    print(f"[generate_proofcard] Wrote {len(written)} ProofCards to {out_dir}")
+    return [Path(p) for p in written]
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Generate a τGuardian ProofCard from enriched JSONL."
@@ -151,6 +345,16 @@ def main() -> None:
         default=None,
         help="Optional path to secret key file for HMAC-SHA256 signature.",
     )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Write one ProofCard_<instance_id>.json per record, in parallel.",
+    )
+    parser.add_argument(
+        "--instance-id-list",
+        default=None,
+        help="Optional file with one instance_id per line to select in --batch mode.",
+    )
     args = parser.parse_args()
 
     enriched_path = Path(args.enriched_path).resolve()
@@ -158,6 +362,21 @@ def main() -> None:
     instance_id = args.instance_id
     sign_key_path = Path(args.sign_key).resolve() if args.sign_key else None
 
+    if args.batch or args.instance_id_list:
+        instance_ids = None
+        if args.instance_id_list:
+            listed = Path(args.instance_id_list).read_text(encoding="utf-8")
+            instance_ids = [ln.strip() for ln in listed.splitlines() if ln.strip()]
+        elif instance_id:
+            instance_ids = [instance_id]
+        generate_proofcards_batch(
+            enriched_path,
+            out_dir,
+            instance_ids=instance_ids,
+            sign_key_path=sign_key_path,
+        )
+        return
+
     generate_proofcard(
         enriched_path,
         out_dir,